@@ -0,0 +1,412 @@
+"""Analysis of San Diego homelessness data.
+
+Pulls together three small datasets -- shelter locations, point-in-time (PIT)
+homeless counts by region, and eviction filings -- and produces a set of
+console summaries plus a text report.  Sample data is bundled in the
+``download_*`` functions so the script runs without network access.
+
+Usage:
+    python homelessness_analysis.py
+"""
+
+import argparse
+import functools
+import math
+import os
+import sys
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+from numba import float32, float64, guvectorize
+
+try:
+    from sklearn.neighbors import BallTree
+except ImportError:  # pragma: no cover - exercised only without sklearn
+    BallTree = None
+
+EARTH_RADIUS_KM = 6371.0
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+SHELTERS_PATH = os.path.join(DATA_DIR, "shelter_locations.parquet")
+PIT_PATH = os.path.join(DATA_DIR, "pit_counts.parquet")
+EVICTIONS_PATH = os.path.join(DATA_DIR, "eviction_filings.parquet")
+REPORT_PATH = os.path.join(DATA_DIR, "summary_report.txt")
+
+# Fixed schemas, applied when the datasets are written so the Parquet
+# files carry final-width column types and nothing is re-inferred on read.
+# Coordinates are 4-decimal data, well within float32 resolution, so they
+# are stored single-precision to halve the distance math's memory traffic.
+SHELTERS_SCHEMA = {
+    "name": pl.Utf8, "type": pl.Utf8, "capacity": pl.Int32,
+    "latitude": pl.Float32, "longitude": pl.Float32,
+}
+PIT_SCHEMA = {
+    "region_name": pl.Utf8, "region_code": pl.Utf8, "year": pl.Int16,
+    "total_count": pl.Int32, "sheltered_count": pl.Int32,
+    "unsheltered_count": pl.Int32, "latitude": pl.Float32,
+    "longitude": pl.Float32, "area_sq_miles": pl.Float64,
+}
+EVICTIONS_SCHEMA = {
+    "region_name": pl.Utf8, "year": pl.Int16,
+    "eviction_filings": pl.Int32, "eviction_judgments": pl.Int32,
+}
+
+
+def download_shelter_locations(output_path=SHELTERS_PATH):
+    """Write the bundled shelter-location sample data to Parquet."""
+    sample_data = [
+        {"name": "Father Joe's Villages", "type": "emergency", "capacity": 800,
+         "latitude": 32.7050, "longitude": -117.1540},
+        {"name": "Alpha Project Bridge Shelter", "type": "bridge", "capacity": 325,
+         "latitude": 32.7020, "longitude": -117.1480},
+        {"name": "Veterans Village of San Diego", "type": "transitional", "capacity": 224,
+         "latitude": 32.7440, "longitude": -117.1960},
+        {"name": "Rachel's Women's Center", "type": "emergency", "capacity": 35,
+         "latitude": 32.7160, "longitude": -117.1590},
+        {"name": "San Diego Rescue Mission", "type": "emergency", "capacity": 350,
+         "latitude": 32.7190, "longitude": -117.1620},
+        {"name": "Interfaith Community Services", "type": "transitional", "capacity": 120,
+         "latitude": 33.1250, "longitude": -117.0860},
+        {"name": "South Bay Community Services", "type": "transitional", "capacity": 90,
+         "latitude": 32.6400, "longitude": -117.0840},
+        {"name": "Operation Hope-North County", "type": "emergency", "capacity": 45,
+         "latitude": 33.1970, "longitude": -117.2460},
+    ]
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    pl.from_dicts(sample_data, schema=SHELTERS_SCHEMA).write_parquet(
+        output_path, compression="zstd")
+    return output_path
+
+
+def download_pit_count_data(output_path=PIT_PATH):
+    """Write the bundled 2024 point-in-time count sample data to Parquet."""
+    sample_data = [
+        {"region_name": "Downtown San Diego", "region_code": "DT", "year": 2024,
+         "total_count": 2260, "sheltered_count": 1430, "unsheltered_count": 830,
+         "latitude": 32.7157, "longitude": -117.1611, "area_sq_miles": 2.2},
+        {"region_name": "East Village", "region_code": "EV", "year": 2024,
+         "total_count": 1110, "sheltered_count": 640, "unsheltered_count": 470,
+         "latitude": 32.7100, "longitude": -117.1500, "area_sq_miles": 0.8},
+        {"region_name": "Midway District", "region_code": "MW", "year": 2024,
+         "total_count": 640, "sheltered_count": 210, "unsheltered_count": 430,
+         "latitude": 32.7480, "longitude": -117.2090, "area_sq_miles": 1.6},
+        {"region_name": "Oceanside", "region_code": "OC", "year": 2024,
+         "total_count": 690, "sheltered_count": 280, "unsheltered_count": 410,
+         "latitude": 33.1959, "longitude": -117.3795, "area_sq_miles": 42.2},
+        {"region_name": "Escondido", "region_code": "ES", "year": 2024,
+         "total_count": 530, "sheltered_count": 250, "unsheltered_count": 280,
+         "latitude": 33.1192, "longitude": -117.0864, "area_sq_miles": 37.3},
+        {"region_name": "Chula Vista", "region_code": "CV", "year": 2024,
+         "total_count": 480, "sheltered_count": 230, "unsheltered_count": 250,
+         "latitude": 32.6401, "longitude": -117.0842, "area_sq_miles": 52.1},
+        {"region_name": "El Cajon", "region_code": "EC", "year": 2024,
+         "total_count": 620, "sheltered_count": 330, "unsheltered_count": 290,
+         "latitude": 32.7948, "longitude": -116.9625, "area_sq_miles": 14.5},
+        {"region_name": "National City", "region_code": "NC", "year": 2024,
+         "total_count": 280, "sheltered_count": 110, "unsheltered_count": 170,
+         "latitude": 32.6781, "longitude": -117.0992, "area_sq_miles": 9.2},
+    ]
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    pl.from_dicts(sample_data, schema=PIT_SCHEMA).write_parquet(
+        output_path, compression="zstd")
+    return output_path
+
+
+def download_eviction_data(output_path=EVICTIONS_PATH):
+    """Write the bundled 2024 eviction-filing sample data to Parquet."""
+    sample_data = [
+        {"region_name": "Downtown San Diego", "year": 2024,
+         "eviction_filings": 410, "eviction_judgments": 260},
+        {"region_name": "East Village", "year": 2024,
+         "eviction_filings": 180, "eviction_judgments": 120},
+        {"region_name": "Oceanside", "year": 2024,
+         "eviction_filings": 350, "eviction_judgments": 210},
+        {"region_name": "Escondido", "year": 2024,
+         "eviction_filings": 290, "eviction_judgments": 190},
+        {"region_name": "Chula Vista", "year": 2024,
+         "eviction_filings": 320, "eviction_judgments": 180},
+        {"region_name": "El Cajon", "year": 2024,
+         "eviction_filings": 270, "eviction_judgments": 175},
+        {"region_name": "National City", "year": 2024,
+         "eviction_filings": 150, "eviction_judgments": 95},
+    ]
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    pl.from_dicts(sample_data, schema=EVICTIONS_SCHEMA).write_parquet(
+        output_path, compression="zstd")
+    return output_path
+
+
+Datasets = namedtuple("Datasets", ["shelters", "pit", "evictions"])
+
+
+@functools.lru_cache(maxsize=1)
+def load_data():
+    """Load the three datasets, returning (shelters, pit, evictions) frames.
+
+    The result is cached so the files are read once per run no matter how
+    many analyzers call this.  The frames stay in polars all the way
+    through the aggregations; conversion to pandas happens only at the
+    display edge.  Derived columns shared by the analyzers are attached
+    here, once, as polars expressions.
+    """
+    shelters = pl.read_parquet(SHELTERS_PATH)
+    pit = pl.scan_parquet(PIT_PATH).with_columns(
+        density=pl.col("total_count") / pl.col("area_sq_miles"),
+        unsheltered_rate=pl.col("unsheltered_count") / pl.col("total_count") * 100,
+    ).collect()
+    evictions = pl.scan_parquet(EVICTIONS_PATH).with_columns(
+        approval_rate=pl.col("eviction_judgments") / pl.col("eviction_filings") * 100,
+    ).collect()
+    return Datasets(shelters, pit, evictions)
+
+
+def analyze_capacity():
+    """Render the shelter capacity vs. point-in-time count section."""
+    shelters, pit, _ = load_data()
+
+    total_capacity = shelters["capacity"].sum()
+    pit_sums = pit.select(
+        pl.col(["total_count", "sheltered_count", "unsheltered_count"]).sum())
+    total_homeless = pit_sums.item(0, "total_count")
+    total_sheltered = pit_sums.item(0, "sheltered_count")
+    total_unsheltered = pit_sums.item(0, "unsheltered_count")
+
+    out = ["=== Shelter Capacity Analysis ===",
+           f"Total shelter capacity:  {total_capacity:,} beds",
+           f"Total homeless (PIT):    {total_homeless:,}",
+           f"  Sheltered:             {total_sheltered:,}",
+           f"  Unsheltered:           {total_unsheltered:,}",
+           f"Capacity shortfall:      {total_homeless - total_capacity:,} beds",
+           f"Occupancy rate:          {total_sheltered / total_capacity * 100:.1f}%",
+           "",
+           "Capacity by shelter type:"]
+    by_type = (shelters.select(["type", "capacity"])
+               .group_by("type")
+               .agg(pl.col("capacity").sum())
+               .sort("capacity", descending=True))
+    for shelter_type, capacity in by_type.iter_rows():
+        out.append(f"  {shelter_type:<14} {capacity:>6,} beds")
+    out.append("")
+    return "\n".join(out) + "\n"
+
+
+def analyze_geographic_distribution(top=None):
+    """Render the homeless counts and density by region section.
+
+    With ``top`` set, only the ``top`` largest regions are shown, found
+    by partial selection instead of a full sort.
+    """
+    _, pit, _ = load_data()
+
+    if top is not None:
+        pit_sorted = pit.top_k(top, by="total_count").sort(
+            "total_count", descending=True)
+    else:
+        pit_sorted = pit.sort("total_count", descending=True)
+    table = pit_sorted.select(["region_name", "total_count", "unsheltered_count",
+                               "unsheltered_rate", "density"]).to_pandas()
+    out = ["=== Geographic Distribution ===",
+           f"{'Region':<20} {'Total':>7} {'Unshelt.':>9} {'Rate':>7} {'Per sq mi':>10}",
+           table.to_string(index=False, header=False, formatters={
+               "region_name": "{:<20}".format,
+               "total_count": "{:>7,}".format,
+               "unsheltered_count": "{:>9,}".format,
+               "unsheltered_rate": "{:>6.1f}%".format,
+               "density": "{:>10.1f}".format,
+           }),
+           ""]
+    return "\n".join(out) + "\n"
+
+
+def analyze_evictions(top=None):
+    """Render the eviction filings and judgment rates section.
+
+    With ``top`` set, only the ``top`` regions with the most filings are
+    shown, found by partial selection instead of a full sort.
+    """
+    _, _, evictions = load_data()
+
+    ev_sums = evictions.select(
+        pl.col(["eviction_filings", "eviction_judgments"]).sum())
+    total_filings = ev_sums.item(0, "eviction_filings")
+    total_judgments = ev_sums.item(0, "eviction_judgments")
+
+    if top is not None:
+        ev_sorted = evictions.top_k(top, by="eviction_filings").sort(
+            "eviction_filings", descending=True)
+    else:
+        ev_sorted = evictions.sort("eviction_filings", descending=True)
+    table = ev_sorted.select(["region_name", "eviction_filings",
+                              "eviction_judgments", "approval_rate"]).to_pandas()
+    out = ["=== Eviction Analysis ===",
+           f"Total filings:    {total_filings:,}",
+           f"Total judgments:  {total_judgments:,}",
+           f"Overall judgment rate: {total_judgments / total_filings * 100:.1f}%",
+           "",
+           f"{'Region':<20} {'Filings':>8} {'Judgments':>10} {'Rate':>7}",
+           table.to_string(index=False, header=False, formatters={
+               "region_name": "{:<20}".format,
+               "eviction_filings": "{:>8,}".format,
+               "eviction_judgments": "{:>10,}".format,
+               "approval_rate": "{:>6.1f}%".format,
+           }),
+           ""]
+    return "\n".join(out) + "\n"
+
+
+@guvectorize([(float32[:], float32[:], float32[:], float32[:], float32[:],
+               float32[:, :]),
+              (float64[:], float64[:], float64[:], float64[:], float64[:],
+               float64[:, :])],
+             "(n),(n),(m),(m),(m)->(n,m)", nopython=True)
+def _haversine_matrix(lat1, lon1, lat2, lon2, cos_lat2, out):
+    """Fill ``out[i, j]`` with the great-circle distance in radians.
+
+    Inputs are in radians; ``cos_lat2`` is the precomputed cosine of the
+    second point set, which is fixed across calls, so no cosine is
+    evaluated inside the pairwise loop.  JIT-compiled so the loop runs
+    as native code instead of interpreted Python.
+    """
+    for i in range(lat1.shape[0]):
+        cos_lat1 = math.cos(lat1[i])
+        for j in range(lat2.shape[0]):
+            dlat = lat2[j] - lat1[i]
+            dlon = lon2[j] - lon1[i]
+            a = (math.sin(dlat / 2) ** 2
+                 + cos_lat1 * cos_lat2[j] * math.sin(dlon / 2) ** 2)
+            out[i, j] = 2.0 * math.asin(math.sqrt(a))
+
+
+@functools.lru_cache(maxsize=1)
+def _shelter_coords_rad():
+    """Shelter (lat, lon) in radians, converted once per run."""
+    shelters = load_data().shelters
+    return np.radians(shelters.select(["latitude", "longitude"]).to_numpy())
+
+
+@functools.lru_cache(maxsize=1)
+def _region_coords_rad():
+    """PIT region (lat, lon) in radians, converted once per run."""
+    pit = load_data().pit
+    return np.radians(pit.select(["latitude", "longitude"]).to_numpy())
+
+
+def calculate_distances():
+    """Find the nearest shelter to each PIT region.
+
+    Shelter coordinates go into a BallTree with the haversine metric, so
+    each region's nearest shelter is a single O(log M) query against a C
+    implementation rather than a scan over every (region, shelter) pair.
+    Without sklearn, a Numba-compiled pairwise kernel does the scan at
+    native speed instead.
+    """
+    shelters, pit, _ = load_data()
+
+    coords_r = _region_coords_rad()
+    coords_s = _shelter_coords_rad()
+
+    if BallTree is not None:
+        tree = BallTree(coords_s, metric="haversine")
+        dist, idx = tree.query(coords_r, k=1)
+        idx = idx.ravel()
+        min_d = dist.ravel() * EARTH_RADIUS_KM
+    else:
+        distances = _haversine_matrix(coords_r[:, 0], coords_r[:, 1],
+                                      coords_s[:, 0], coords_s[:, 1],
+                                      np.cos(coords_s[:, 0]))
+        idx = distances.argmin(axis=1)
+        min_d = distances[np.arange(len(pit)), idx] * EARTH_RADIUS_KM
+    nearest = pl.DataFrame({
+        "region_name": pit["region_name"],
+        "shelter_name": shelters["name"].gather(idx),
+        "distance_km": min_d,
+    })
+
+    out = ["=== Nearest Shelter by Region ==="]
+    for region_name, shelter_name, distance_km in nearest.iter_rows():
+        out.append(f"{region_name:<20} -> {shelter_name:<30} "
+                   f"{distance_km:>6.1f} km")
+    out.append("")
+    return "\n".join(out) + "\n"
+
+
+def generate_summary_statistics():
+    """Render the headline figures across all three datasets."""
+    shelters, pit, evictions = load_data()
+
+    out = ["=== Summary Statistics ===",
+           f"Regions surveyed:        {len(pit)}",
+           f"Shelters tracked:        {len(shelters)}",
+           f"Total homeless (PIT):    {pit['total_count'].sum():,}",
+           f"Total shelter capacity:  {shelters['capacity'].sum():,}",
+           f"Total eviction filings:  {evictions['eviction_filings'].sum():,}",
+           ""]
+    return "\n".join(out) + "\n"
+
+
+def export_summary(output_path=REPORT_PATH):
+    """Write the headline figures to a plain-text report."""
+    shelters, pit, evictions = load_data()
+
+    total_capacity = shelters["capacity"].sum()
+    pit_sums = pit.select(pl.col(["total_count", "unsheltered_count"]).sum())
+    total_homeless = pit_sums.item(0, "total_count")
+    total_unsheltered = pit_sums.item(0, "unsheltered_count")
+    total_filings = evictions["eviction_filings"].sum()
+
+    report = f"""\
+San Diego Homelessness Summary
+{"=" * 30}
+Regions surveyed:        {len(pit)}
+Shelters tracked:        {len(shelters)}
+Total homeless (PIT):    {total_homeless:,}
+  Unsheltered:           {total_unsheltered:,}
+Total shelter capacity:  {total_capacity:,}
+Capacity shortfall:      {total_homeless - total_capacity:,}
+Total eviction filings:  {total_filings:,}
+"""
+    Path(output_path).write_text(report)
+    print(f"Report written to {output_path}")
+
+
+def _positive_int(value):
+    """argparse converter that accepts only integers >= 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value!r}")
+    return number
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--top", type=_positive_int, default=None,
+                        help="show only the top N regions in the ranked tables")
+    args = parser.parse_args(argv)
+
+    download_shelter_locations()
+    download_pit_count_data()
+    download_eviction_data()
+
+    load_data()  # warm the cache before the analyzers race to fill it
+    analyzers = [
+        analyze_capacity,
+        functools.partial(analyze_geographic_distribution, top=args.top),
+        functools.partial(analyze_evictions, top=args.top),
+        calculate_distances,
+        generate_summary_statistics,
+    ]
+    # The analyzers are independent once the cache is warm, and the
+    # polars/NumPy kernels release the GIL, so run them concurrently and
+    # write the sections in their original order.
+    with ThreadPoolExecutor() as executor:
+        for section in executor.map(lambda analyze: analyze(), analyzers):
+            sys.stdout.write(section)
+    export_summary()
+
+
+if __name__ == "__main__":
+    main()